@@ -11,10 +11,10 @@ from database import *
 # Create main window
 window = tk.Tk()
 window.title("ABC Tune Database")
-window.geometry("800x600")
+window.geometry("800x750")
 
 # Results display
-results_text = tk.Text(window, width=70, height=25)
+results_text = tk.Text(window, width=70, height=20)
 results_text.pack(pady=10)
 
 # Load Files button
@@ -108,6 +108,67 @@ def filter_book_click():
 btn_filter_book = tk.Button(book_frame, text="Filter", command=filter_book_click, width=10)
 btn_filter_book.pack(side=tk.LEFT)
 
+# Advanced search section (all filled in fields must match)
+query_frame = tk.Frame(window)
+query_frame.pack(pady=5)
+
+# split over two rows of labels and fields so it fits the window width
+query_entries = {}
+for i, (name, label) in enumerate([('title', 'Title'), ('book', 'Book'), ('rhythm', 'Rhythm'),
+                                   ('key', 'Key'), ('meter', 'Meter'), ('composer', 'Composer'),
+                                   ('limit', 'Limit')]):
+    row, col = (i // 5) * 2, i % 5
+    tk.Label(query_frame, text=label).grid(row=row, column=col)
+    query_entries[name] = tk.Entry(query_frame, width=12)
+    query_entries[name].grid(row=row + 1, column=col, padx=2)
+
+tempo_var = tk.StringVar(value='Any')
+tk.Label(query_frame, text="Tempo").grid(row=2, column=2)
+tk.OptionMenu(query_frame, tempo_var, 'Any', 'Yes', 'No').grid(row=3, column=2)
+
+sort_var = tk.StringVar(value=DEFAULT_SORT)
+tk.Label(query_frame, text="Sort by").grid(row=2, column=3)
+tk.OptionMenu(query_frame, sort_var, *SORT_FIELDS).grid(row=3, column=3)
+
+def advanced_search_click():
+    """
+    Search for tunes matching every filled in field of the advanced search.
+    Empty fields are ignored. Displays matching tunes or a 'No tunes found' message.
+    """
+    results_text.delete(1.0, tk.END)
+    values = {name: entry.get().strip() for name, entry in query_entries.items()}
+
+    try:
+        book = int(values['book']) if values['book'] else None
+        limit = int(values['limit']) if values['limit'] else None
+    except ValueError:
+        messagebox.showerror("Error", "Book and Limit must be whole numbers!")
+        return
+
+    has_tempo = {'Yes': True, 'No': False}.get(tempo_var.get())
+
+    df, index = load_indexed_dataframe()
+    try:
+        results = query_tunes(df, title=values['title'], book=book, rhythm=values['rhythm'],
+                              key=values['key'], meter=values['meter'], composer=values['composer'],
+                              has_tempo=has_tempo, sort_by=sort_var.get(), limit=limit, index=index)
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
+
+    if results.empty:
+        results_text.insert(tk.END, "No tunes found!")
+    else:
+        results_text.insert(tk.END, f"Found {len(results)} tune(s)\n\n")
+        for idx, row in results.iterrows():
+            results_text.insert(tk.END, f"Title: {row['title']}\n")
+            results_text.insert(tk.END, f"Key: {row['key_signature']} | Meter: {row['meter']}\n")
+            results_text.insert(tk.END, f"Rhythm: {row['rhythm']} | Book: {row['book_number']}\n")
+            results_text.insert(tk.END, "-" * 50 + "\n")
+
+btn_query = tk.Button(query_frame, text="Search", command=advanced_search_click, width=10)
+btn_query.grid(row=3, column=4, padx=5)
+
 # Statistics button (basic stats)
 # def stats_click():
 #     """
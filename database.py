@@ -68,6 +68,7 @@ def insert_tune(tune):
     conn.commit()
     cursor.close()
     conn.close()
+    _invalidate_index()
 
 def insert_all_tunes(tunes):
     """Insert all tunes into database"""
@@ -82,6 +83,7 @@ def clear_database():
     conn.commit()
     cursor.close()
     conn.close()
+    _invalidate_index()
 
 def load_dataframe():
     """Load all tunes from database into pandas DataFrame"""
@@ -113,4 +115,145 @@ def count_tunes_per_book(df):
 
 def get_all_rhythms(df):
     """Get list of unique rhythms"""
-    return df['rhythm'].dropna().unique()
\ No newline at end of file
+    return df['rhythm'].dropna().unique()
+
+# Combined query (query_tunes). build_index() keeps a posting list (set of row
+# positions) for every distinct value of these columns, and plan_query() sorts
+# the filters by how many rows they match so the smallest set is intersected
+# first. Nothing touches the DataFrame until the final df.iloc[], and the index
+# is cached per loaded frame so a search is only set lookups and intersections.
+# 'exact' fields are looked up directly, 'contains' fields do a case-insensitive
+# substring match over the distinct values only (same as get_tunes_by_type).
+INDEXED_FIELDS = {
+    'book_number': 'exact',
+    'rhythm': 'contains',
+    'key_signature': 'exact',
+    'meter': 'exact',
+    'composer': 'contains',
+}
+
+SORT_FIELDS = ['title', 'book_number', 'rhythm', 'key_signature', 'meter', 'composer', 'id']
+DEFAULT_SORT = 'title'
+
+_index_cache = None # (df, index) from the last load_indexed_dataframe() call
+
+def _normalise(value):
+    """Turn a cell value into a lowercase string key (None/NaN become '')"""
+    if value is None or pd.isna(value):
+        return ''
+    return str(value).strip().lower()
+
+def _index_key(field, value):
+    """Key a value is stored under in the index (book numbers are compared as integers)"""
+    if field == 'book_number':
+        if value is None or pd.isna(value):
+            return None
+        if value != int(value):
+            raise ValueError(f"Book number must be a whole number, got {value}")
+        return int(value)
+    return _normalise(value)
+
+def build_index(df):
+    """Build the posting lists used by query_tunes"""
+    index = {field: {} for field in INDEXED_FIELDS}
+    for field in INDEXED_FIELDS:
+        postings = index[field]
+        for pos, value in enumerate(df[field].tolist()):
+            postings.setdefault(_index_key(field, value), set()).add(pos)
+
+    index['has_tempo'] = {pos for pos, value in enumerate(df['tempo'].tolist()) if _normalise(value)}
+    index['all'] = set(range(len(df)))
+    return index
+
+def load_indexed_dataframe():
+    """Load all tunes with their query index, reusing the cached pair until the table changes"""
+    global _index_cache
+    if _index_cache is None:
+        df = load_dataframe()
+        _index_cache = (df, build_index(df))
+    return _index_cache
+
+def _invalidate_index():
+    """Drop the cached DataFrame and index after the tunes table changes"""
+    global _index_cache
+    _index_cache = None
+
+def _lookup(index, field, value):
+    """Return the set of row positions matching one indexed filter"""
+    postings = index[field]
+    term = _index_key(field, value)
+    if INDEXED_FIELDS[field] == 'exact':
+        return postings.get(term, set())
+
+    matches = set()
+    for distinct, positions in postings.items():
+        if term in distinct:
+            matches |= positions
+    return matches
+
+def plan_query(index, filters):
+    """Return (field, positions) for each filter, most selective first"""
+    steps = []
+    for field, value in filters.items():
+        if field == 'has_tempo':
+            positions = index['has_tempo'] if value else index['all'] - index['has_tempo']
+        else:
+            positions = _lookup(index, field, value)
+        steps.append((field, positions))
+
+    steps.sort(key=lambda step: len(step[1]))
+    return steps
+
+def _sort_key(value, field):
+    """Sort key that puts missing values last and compares text case-insensitively"""
+    if value is None or pd.isna(value) or value == '':
+        return (1, '')
+    if field in ('book_number', 'id'):
+        return (0, int(value))
+    return (0, _normalise(value))
+
+def query_tunes(df, title=None, book=None, rhythm=None, key=None, meter=None,
+                composer=None, has_tempo=None, sort_by=None, limit=None, index=None):
+    """Get tunes matching every given criterion (None or blank criteria are ignored)"""
+    if sort_by is not None and sort_by not in SORT_FIELDS:
+        raise ValueError(f"Cannot sort by '{sort_by}', choose one of: {', '.join(SORT_FIELDS)}")
+    if limit is not None and limit < 0:
+        raise ValueError(f"Maximum results cannot be negative, got {limit}")
+
+    if index is None:
+        index = build_index(df)
+
+    filters = {}
+    if book is not None:
+        filters['book_number'] = book
+    text_filters = {'rhythm': rhythm, 'key_signature': key, 'meter': meter, 'composer': composer}
+    for field, value in text_filters.items():
+        term = _normalise(value)
+        if term: # blank or whitespace-only text would match every row
+            filters[field] = term
+    if has_tempo is not None:
+        filters['has_tempo'] = has_tempo
+
+    candidates = None
+    for field, positions in plan_query(index, filters):
+        candidates = set(positions) if candidates is None else candidates & positions
+        if not candidates: # nothing left to match, skip the remaining lists
+            break
+    if candidates is None:
+        candidates = index['all']
+
+    term = _normalise(title)
+    if term:
+        titles = df['title'].tolist()
+        candidates = {pos for pos in candidates if term in _normalise(titles[pos])}
+
+    if sort_by is None:
+        positions = sorted(candidates)
+    else:
+        column = df[sort_by].tolist()
+        positions = sorted(candidates, key=lambda pos: _sort_key(column[pos], sort_by))
+
+    if limit is not None:
+        positions = positions[:limit]
+
+    return df.iloc[positions]
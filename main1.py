@@ -24,6 +24,7 @@ def display_menu():
     print("5. View tunes by rhythm/type")
     print("6. Show statistics")
     print("7. Clear database")
+    print("8. Advanced search (combine filters)")
     print("0. Exit")
     print("="*50)
 
@@ -135,6 +136,41 @@ def view_by_rhythm():
     results = get_tunes_by_type(df, rhythm)
     display_dataframe(results)
 
+def advanced_search():
+    """
+    Prompt the user for several criteria at once and display the tunes that 
+    match all of them. Any prompt left blank is ignored.
+    """
+    print("\nLeave a field blank to skip it.")
+    title = input("Title contains: ").strip()
+    book = input("Book number: ").strip()
+    rhythm = input("Rhythm: ").strip()
+    key = input("Key (e.g. Dmaj): ").strip()
+    meter = input("Meter (e.g. 6/8): ").strip()
+    composer = input("Composer: ").strip()
+    tempo = input("Has tempo? (y/n): ").strip().lower()
+    sort_by = input(f"Sort by ({', '.join(SORT_FIELDS)}) [{DEFAULT_SORT}]: ").strip()
+    limit = input("Maximum results: ").strip()
+
+    try:
+        book = int(book) if book else None
+        limit = int(limit) if limit else None
+    except ValueError:
+        print("\nInvalid input. Book number and maximum results must be integers.")
+        return
+
+    has_tempo = {'y': True, 'n': False}.get(tempo) # anything else means don't filter
+
+    df, index = load_indexed_dataframe()
+    try:
+        results = query_tunes(df, title=title, book=book, rhythm=rhythm, key=key, meter=meter,
+                              composer=composer, has_tempo=has_tempo,
+                              sort_by=sort_by or DEFAULT_SORT, limit=limit, index=index)
+    except ValueError as e:
+        print(f"\n{e}")
+        return
+    display_dataframe(results)
+
 def show_statistics():
     """
     Calculate and display various statistics about the tunes in the database, 
@@ -185,6 +221,8 @@ def main():
         elif choice == '7':
             clear_database()
             print("Database cleared!")
+        elif choice == '8':
+            advanced_search()
         elif choice == '0':
             print("\nGoodbye!")
             break